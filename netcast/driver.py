@@ -12,6 +12,7 @@ from netcast import common
 from netcast.exceptions import NetcastError
 from netcast.serializer import Serializer, SettingsT, Interface
 from netcast.tools.collections import IDLookupDictionary
+from netcast.tools.inspection import get_members
 
 if typing.TYPE_CHECKING:
     from netcast.common import ModelSerializer
@@ -56,7 +57,7 @@ class DriverMeta(type):
         return serializer(*components, **settings)
 
     def lookup_model_serializer(cls, model: Model, /, **settings) -> Serializer:
-        components = model.choose_components(**settings).values()
+        components = model._choose_components(**settings).values()
         model_serializer = getattr(model, "serializer", None)
         if model_serializer is None:
             model_serializer = cls.default_model_serializer
@@ -131,7 +132,7 @@ class Driver(metaclass=DriverMeta):
             cls._init_model_serializer
         )
 
-        for _, member in inspect.getmembers(cls, _check_impl):
+        for _, member in get_members(cls, _check_impl):
             cls.impl(member)
 
         cls.DEBUG = __debug__
@@ -3,7 +3,9 @@ from __future__ import annotations  # Python 3.8
 import collections.abc
 import contextlib
 import functools
-import inspect
+import sys
+import types
+import weakref
 from typing import Any, cast, ClassVar, Type, TypeVar, Union
 
 from netcast.constants import MISSING, GREATEST
@@ -11,6 +13,7 @@ from netcast.driver import DriverMeta, Driver, load_driver
 from netcast.serializer import Interface, SettingsT, Serializer
 from netcast.stack import Stack, VersionAwareStack
 from netcast.tools import strings
+from netcast.tools.inspection import get_members
 from netcast.tools.collections import IDLookupDictionary, classproperty
 
 
@@ -27,6 +30,7 @@ __all__ = (
 FIELD_NAME_ESCAPE = "f__"
 REPEATED_NAME_TEMPLATE = "%(name)s[%(size)d]"
 REPEATED_MEMBER_NAME_TEMPLATE = "%(name)s_%(index)d"
+COMPONENTS_CACHE_SIZE = 128
 
 
 def escape(field_name: str) -> str:
@@ -37,26 +41,48 @@ def unescape(field_name: str) -> str:
     return strings.remove_prefix(field_name, FIELD_NAME_ESCAPE)
 
 
+def _drop_states(fields: tuple[Field, ...], id_of_model: int):
+    """Drop the states of a collected model from the stores of its fields."""
+    for field in fields:
+        store = field.models if field.refers_to_model else field.states
+        if store:
+            store.pop(id_of_model, None)
+
+
 class ModelProperty:
+    __slots__ = ()
+
     component: ComponentT
 
 
 class Field(ModelProperty):
+    __slots__ = ("component", "refers_to_model", "states", "models")
+
     def __init__(self, component: ComponentT):
         self.component = component
-        self.states = IDLookupDictionary()
-        self.models = IDLookupDictionary()
-
-    @functools.cached_property
-    def refers_to_model(self):
-        return isinstance(self.component, type) and issubclass(self.component, Model)
+        self.refers_to_model = isinstance(component, type) and issubclass(
+            component, Model
+        )
+        # Only one of these is ever used, depending on refers_to_model
+        self.states = None
+        self.models = None
+
+    def _get_states(self) -> dict[int, Any]:
+        if self.states is None:
+            self.states = {}
+        return self.states
+
+    def _get_models(self) -> dict[int, Model]:
+        if self.models is None:
+            self.models = {}
+        return self.models
 
     def get_component(self, model: Model) -> Serializer | Model:
         if self.refers_to_model:
-            component = self.models.get(model)
+            models = self._get_models()
+            component = models.get(id(model))
             if component is None:
-                component = self.component()
-                self.models[model] = component
+                component = models[id(model)] = self.component()
         else:
             component = self.component
         return component
@@ -68,7 +94,12 @@ class Field(ModelProperty):
             if settings is None:
                 settings = {}
             return self.get_component(instance).get_state(empty, **settings)
-        state = self.states.setdefault(instance, empty)
+        states = self._get_states()
+        id_of_instance = id(instance)
+        if id_of_instance in states:
+            state = states[id_of_instance]
+        else:
+            state = states[id_of_instance] = empty
         return empty if state is MISSING else state
 
     def __get__(self, instance: Model | None, owner: type[Model] | None) -> Any:
@@ -86,7 +117,7 @@ class Field(ModelProperty):
             else:
                 model.set_state(state)
         else:
-            self.states[instance] = state
+            self._get_states()[id(instance)] = state
 
     def __call__(self, state) -> Any:
         self.__set__(state=state)
@@ -97,6 +128,8 @@ class Field(ModelProperty):
 
 
 class FieldAlias(ModelProperty):
+    __slots__ = ("ancestor",)
+
     def __init__(self, ancestor: Field):
         self.ancestor = ancestor
 
@@ -132,6 +165,14 @@ class Model:
     _repeated_name_template = None
     _repeated_member_name_template = None
 
+    def __new__(cls, *args: Any, **kwargs: Any):
+        self = super().__new__(cls)
+        # A single callback per model clears its states from every field store.
+        # Registered here rather than in __init__, which copy and pickle skip.
+        finalizer = weakref.finalize(self, _drop_states, cls._fields, id(self))
+        finalizer.atexit = False
+        return self
+
     def __init__(
         self,
         defaults: dict[str, Any] | None = None,
@@ -171,17 +212,17 @@ class Model:
         self.propagate_driver = propagate_driver
         self.settings = {**self.settings, **settings}
 
-    def _choose_descriptors(self, settings: SettingsT) -> dict[Any, Field]:
-        namespace = set(self.choose_components(**settings))
-        descriptors = {
-            name: desc for name, desc in self._descriptors.items() if name in namespace
-        }
-        return descriptors
+    def _choose_descriptors(self, settings: SettingsT) -> tuple[tuple[Any, Field], ...]:
+        return self._choose(**settings)[1]
 
     def _infer_states(self, settings: SettingsT):
-        for key in settings.copy():
-            if key in self._descriptors:
-                self[key] = settings.pop(key)
+        if not settings:
+            return
+        descriptors = self._descriptors
+        # Not a keys() intersection: keep the passed order, so that an alias and
+        # its field given together resolve deterministically
+        for key in [key for key in settings if key in descriptors]:
+            self[key] = settings.pop(key)
 
     def _init_defaults(self):
         for key, value in self.default.items():
@@ -191,7 +232,7 @@ class Model:
     @property
     def default(self) -> Any:
         defaults = self._defaults.copy()
-        for name, descriptor in self._descriptors.items():
+        for name, descriptor in self._descriptor_items:
             model = descriptor.get_component(self)
             default = model.default
             if default is not MISSING:
@@ -206,29 +247,79 @@ class Model:
     def configure(cls, **settings):
         cls.name = settings.pop("name", cls.name)
         cls.settings.update(settings)
+        Stack.settings_changed()
         return cls
 
     def get_state(self, empty=MISSING, /, **settings: Any) -> dict:
+        """
+        Return the states of the fields chosen for the given settings.
+
+        NOTE: this, like dump() and load(), is object-level glue with no numeric loops.
+        Wrapping it with a JIT compiler such as numba.njit only adds dispatch overhead.
+        """
         descriptors = self._choose_descriptors(settings)
-        states = {}
+        states = {
+            name: descriptor.get_state(self, empty, settings)
+            for name, descriptor in descriptors
+        }
 
-        for name, descriptor in descriptors.items():
-            state = descriptor.get_state(self, empty, settings)
-            if state is MISSING:
-                if empty is not MISSING:
-                    state = empty
-                else:
+        # Fields fall back to the empty value on their own,
+        # so a MISSING state is only possible when no empty value was given
+        if empty is MISSING:
+            for name, descriptor in descriptors:
+                if states[name] is MISSING:
                     raise ValueError(
                         f"missing required {type(descriptor.component).__name__} "
                         f"value for serializer named {descriptor.component.name!r}"
                     )
-            states[name] = state
 
         return states
 
-    def choose_components(self, **settings: Any) -> dict[Any, ComponentT]:
-        settings = {**settings, **self.settings}
-        return self.stack.choose_components(settings)
+    def choose_components(self, **settings: Any) -> collections.abc.Mapping[Any, ComponentT]:
+        """
+        Return the components chosen for the given settings, by name.
+
+        Choices are cached per stack contents and settings, and shared by all instances,
+        so the returned mapping is read-only. Components must be reconfigured through
+        configure() for the change to be seen: editing their settings dict in place is not.
+        """
+        return types.MappingProxyType(self._choose_components(**settings))
+
+    def _choose_components(self, **settings: Any) -> dict[Any, ComponentT]:
+        return self._choose(**settings)[0]
+
+    def _choose(
+        self, **settings: Any
+    ) -> tuple[dict[Any, ComponentT], tuple[tuple[Any, Field], ...]]:
+        """Return the chosen components along with the descriptors of their fields."""
+        if settings:
+            settings.update(self.settings)  # our own copy, no need to merge into a new one
+        else:
+            settings = self.settings
+
+        # The choice only depends on the stack contents and the settings.
+        # Cached choices are shared, so they must not be modified here.
+        stack = self.stack
+        try:
+            key = (stack.revision, stack.settings_revision, frozenset(settings.items()))
+        except TypeError:  # unhashable setting value
+            return self._make_choice(stack, settings)
+        cache = self._components_cache
+        choice = cache.get(key)
+        if choice is None:
+            if len(cache) >= COMPONENTS_CACHE_SIZE:
+                cache.clear()
+            choice = cache[key] = self._make_choice(stack, settings)
+        return choice
+
+    def _make_choice(
+        self, stack: Stack, settings: SettingsT
+    ) -> tuple[dict[Any, ComponentT], tuple[tuple[Any, Field], ...]]:
+        components = stack.choose_components(settings)
+        descriptors = tuple(
+            (name, desc) for name, desc in self._descriptor_items if name in components
+        )
+        return components, descriptors
 
     def with_(self, **values):
         return self.set_state(values)
@@ -236,9 +327,10 @@ class Model:
     def impl(
         self, driver: DriverArgT = None, settings: SettingsT = None, final: bool = False
     ):
-        if settings is None:
-            settings = {}
-        settings = {**settings, **self.settings}
+        if settings:
+            settings = {**settings, **self.settings}
+        else:
+            settings = self.settings.copy()
         default_driver = self.default_driver
 
         if driver is None:
@@ -255,12 +347,13 @@ class Model:
                 raise ValueError(f"no driver named {driver_name!r} available")
 
         if isinstance(driver, DriverMeta):
-            settings.update(name=self.name)
+            settings["name"] = self.name
             serializer = driver.lookup_model_serializer(self, **settings)
 
         else:
             serializer = driver
-            settings.update(name=self.name, default=self.default)
+            settings["name"] = self.name
+            settings["default"] = self.default
             serializer = serializer.get_dep(serializer, **settings)
 
         if final:
@@ -269,6 +362,7 @@ class Model:
         return serializer
 
     def dump(self, driver: DriverArgT = None, /, **settings: Any) -> Any:
+        """Dump the model state using the given or the default driver."""
         serializer = self.impl(driver, settings)
         source = serializer.ensure_load_type(self.get_state(**settings))
         return serializer.dump(source, settings)
@@ -276,6 +370,7 @@ class Model:
     def load(
         self, driver: DriverArgT = None, dump: Any = MISSING, /, **settings
     ) -> Model:
+        """Load a dump using the given or the default driver and set the model state to it."""
         return self.load_state(self.load_externally(driver, dump, **settings))
 
     def load_externally(
@@ -288,7 +383,11 @@ class Model:
         return serializer.load(source, settings)
 
     def load_state(self, load: Any):
-        state = self.read_state(load)
+        if type(load) is dict:
+            # Skip the dispatch for the most common case
+            state = load
+        else:
+            state = self.read_state(load)
         self.set_state(state)
         return self
 
@@ -297,30 +396,35 @@ class Model:
     def priority(cls):
         return cls.settings.setdefault("priority", 0)
 
-    @functools.singledispatchmethod
     def read_state(self, load: Any) -> dict | tuple[tuple[str, Any], ...]:
+        if isinstance(load, collections.abc.Mapping):
+            return self.read_mapping_state(load)
+        if isinstance(load, collections.abc.Sequence) and not isinstance(
+            load, (str, bytes, bytearray, memoryview)
+        ):
+            return self.read_sequence_state(load)
         raise TypeError(f"unsupported state type: {type(load).__name__}")
 
-    @read_state.register
     def read_sequence_state(self, load: collections.abc.Sequence) -> "dict[str, Any]":
-        return dict(zip(self._descriptors, load))
+        return dict(zip(self._descriptor_names, load))
 
-    @read_state.register
     def read_mapping_state(self, load: collections.abc.Mapping) -> dict:
         return dict(load)
 
     def set_state(self, state: dict):
-        if callable(getattr(state, "items", None)):
+        if isinstance(state, dict) or isinstance(state, collections.abc.Mapping):
             state = state.items()
+        setters = self._descriptor_setters
         for item, value in state:
-            try:
-                self[item] = value
-            except KeyError:
-                pass
+            setter = setters.get(item)
+            if setter is not None:
+                setter(self, value)
         return self
 
     def clear(self):
-        return self.set_state(dict.fromkeys(self._descriptors, MISSING))
+        for setter in self._descriptor_setters.values():
+            setter(self, MISSING)
+        return self
 
     @classmethod
     def clone(cls, name=None, settings=None):
@@ -333,21 +437,22 @@ class Model:
         return create_model(stack=cls.stack, name=name, **new_settings)
 
     def __iter__(self):
-        for name in self._descriptors:
-            yield name, self[name]
+        for name, getter in self._descriptor_getters.items():
+            yield name, getter(self, None)
 
     def __setitem__(self, key: Any, value: Any):
-        self._descriptors[key].__set__(self, value)
+        self._descriptor_setters[key](self, value)
 
     def __class_getitem__(cls, repeat):
         return repeated(cls, repeat, name=cls.name)
 
     def __getitem__(self, key: Any):
-        return self._descriptors[key].__get__(self, None)
+        return self._descriptor_getters[key](self, None)
 
     def __setattr__(self, key: str, value: Any):
-        if key in self._descriptors:
-            self._descriptors[key].__set__(self, value)
+        setter = self._descriptor_setters.get(key)
+        if setter is not None:
+            setter(self, value)
             return
         # TODO: find a better way to do it
         object.__setattr__(self, key, value)
@@ -363,13 +468,10 @@ class Model:
             return NotImplemented
 
         state = self.get_state()
-        other_state = dict.fromkeys(self.get_state(), GREATEST)
-        input_state = other.get_state()
-
-        for key in state.keys() & input_state.keys():
-            other_state[key] = input_state[key]
-
-        return tuple(state.values()) < tuple(other_state.values())
+        other_state = other.get_state()
+        return tuple(state.values()) < tuple(
+            other_state.get(key, GREATEST) for key in state
+        )
 
     @classmethod
     def _build_stack(cls, stack, settings):
@@ -378,7 +480,7 @@ class Model:
         seen_descriptors = IDLookupDictionary()
 
         for idx, (attribute, component) in enumerate(
-            inspect.getmembers(cls, check_component), start=1
+            get_members(cls, check_component), start=1
         ):
             seen = seen_descriptors.get(component)
             attribute_unescaped = unescape(attribute)
@@ -398,6 +500,7 @@ class Model:
                 name = attribute_unescaped
                 field = cls._field_alias_class(seen)
 
+            name = sys.intern(name)
             setattr(cls, name, field)
 
             descriptors[name] = field
@@ -406,6 +509,7 @@ class Model:
         final.update(sorted(descriptors.items(), key=lambda kv: kv[1].priority))
         descriptors.clear()
         seen_descriptors.clear()
+        cls._freeze_descriptors()
 
     @classmethod
     def _load_stack(cls, stack, settings: SettingsT):
@@ -413,12 +517,35 @@ class Model:
         cls._descriptors = descriptors = collections.OrderedDict()
 
         for idx, (name, component) in enumerate(components.items(), start=1):
+            name = sys.intern(name)
             component.settings.setdefault("priority", idx)
             descriptor = descriptors[name] = cls._field_class(component)
             while isinstance(getattr(cls, name, None), ModelProperty):
                 name = escape(name)
             setattr(cls, name, descriptor)
 
+        cls._freeze_descriptors()
+
+    @classmethod
+    def _freeze_descriptors(cls):
+        descriptors = cls._descriptors
+        cls._descriptor_items = tuple(descriptors.items())
+        cls._descriptor_names = tuple(descriptors)
+        # Resolve the descriptor protocol methods once, not on every item access
+        cls._descriptor_getters = {
+            name: descriptor.__get__ for name, descriptor in descriptors.items()
+        }
+        cls._descriptor_setters = {
+            name: descriptor.__set__ for name, descriptor in descriptors.items()
+        }
+        # Every field an instance can store states in, inherited ones included
+        fields = {}
+        for _, descriptor in get_members(cls, _is_model_property):
+            while isinstance(descriptor, FieldAlias):
+                descriptor = descriptor.ancestor
+            fields[id(descriptor)] = descriptor
+        cls._fields = tuple(fields.values())
+
     @classmethod
     def _normalize_settings(cls, settings: SettingsT):
         normalized = {}
@@ -448,14 +575,17 @@ class Model:
                     for component in include_from:
                         stack.push(component)
                 else:
-                    for name in include:
-                        matched = tuple(
-                            filter(lambda comp: comp.name == name, include_from)
-                        )
+                    components_by_name = {}
+                    for component in include_from:
+                        components_by_name.setdefault(component.name, []).append(component)
+                    for component_name in include:
+                        matched = components_by_name.get(component_name, ())
                         if len(matched) > 1:
-                            raise ValueError(f"multiple components match name {name!r}")
-                        if len(matched) == 0:
-                            raise ValueError(f"no component matches name {name!r}")
+                            raise ValueError(
+                                f"multiple components match name {component_name!r}"
+                            )
+                        if not matched:
+                            raise ValueError(f"no component matches name {component_name!r}")
                         stack.push(*matched)
 
         settings = cls._normalize_settings(settings)
@@ -470,6 +600,7 @@ class Model:
 
         cls.stack = stack
         cls.settings = settings
+        cls._components_cache = {}
 
         if name is None:
             name = cls.__name__.casefold()
@@ -480,14 +611,21 @@ ComponentT = TypeVar("ComponentT", Serializer, Model)
 ComponentArgT = Union[ComponentT, Type[ComponentT]]
 
 
+_COMPONENT_TYPES = (Serializer, Model)
+
+
+def _is_model_property(obj: Any) -> bool:
+    return isinstance(obj, ModelProperty)
+
+
 def check_component(obj: Any, acknowledge_type: bool = True) -> bool:
-    is_instance = isinstance(obj, (Serializer, Model))
-    is_type = (
+    if isinstance(obj, _COMPONENT_TYPES):
+        return True
+    return (
         acknowledge_type
         and isinstance(obj, type)
-        and issubclass(obj, (Serializer, Model))
+        and issubclass(obj, _COMPONENT_TYPES)
     )
-    return is_instance or is_type
 
 
 def create_model(
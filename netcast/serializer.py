@@ -82,6 +82,12 @@ class Serializer:
 
     def configure(self, **settings):
         """Configure this serializer, possibly applying new settings to public attributes."""
+        if self.contained:
+            current = self.settings
+            if any(current.get(key, MISSING) is not value for key, value in settings.items()):
+                from netcast.stack import Stack
+
+                Stack.settings_changed()
         self.settings.update(settings)
         matched = match_params(self._configure, self.settings)
         self._configure(**matched)
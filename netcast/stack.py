@@ -6,7 +6,7 @@ import operator
 import string
 import threading
 import typing
-from typing import Callable, Type
+from typing import Callable, ClassVar, Type
 
 from netcast import GREATEST, LEAST
 from netcast.tools.collections import Comparable
@@ -32,6 +32,9 @@ class _PrioritySortWrapper:
 
 
 class Stack:
+    # Bumped whenever a component is reconfigured, shared by all stacks
+    settings_revision: ClassVar[int] = 0
+
     def __init__(
         self,
         name: str | None = None,
@@ -43,6 +46,7 @@ class Stack:
         self.default_name_template = default_name_template
         self._components = []
         self._lock = threading.RLock()
+        self.revision = 0  # bumped on every change, so that choices can be cached
 
     def add(
         self,
@@ -61,17 +65,15 @@ class Stack:
         return transformed
 
     def all(self):
-        return self._components.copy()
+        return [wrapper.component for wrapper in self._components]
 
     def discard(self, component: ComponentT):
-        self._lock.acquire()
-        try:
-            idx = self._components.index(component)
-        except IndexError:
-            idx = None
-        self._lock.release()
-        if idx is not None:
-            self.pop(idx)
+        # Compare by identity, components may define expensive (or no) equality
+        with self._lock:
+            for idx, wrapper in enumerate(self._components):
+                if wrapper.component is component:
+                    self.pop(idx)
+                    return
 
     def default_name(self):
         fmt = {"name": self.name, "index": len(self._components) + 1}
@@ -85,49 +87,50 @@ class Stack:
         return name
 
     def push(self, component: ComponentT):
-        self._lock.acquire()
-        name = getattr(component, "name", None)
-        if name is None:
-            component.name = self.default_name()
-        heapq.heappush(self._components, _PrioritySortWrapper(component))
-        self._lock.release()
+        # heapq calls back into Python-level comparisons, so this is not atomic under the GIL
+        with self._lock:
+            name = getattr(component, "name", None)
+            if name is None:
+                component.name = self.default_name()
+            heapq.heappush(self._components, _PrioritySortWrapper(component))
+            self.revision += 1
 
     def pop(self, index: int | None = None) -> ComponentT | None:
-        self._lock.acquire()
-        if index is None:
-            obj = heapq.heappop(self._components)
-        else:
-            obj = self._components.pop(index)
-        self._lock.release()
+        with self._lock:
+            if index is None:
+                obj = heapq.heappop(self._components)
+            else:
+                obj = self._components.pop(index)
+                heapq.heapify(self._components)
+            self.revision += 1
         return obj
 
     def get(self, index: int = -1, settings: SettingsT = None) -> ComponentT | None:
-        self._lock.acquire()
+        # A single list lookup is atomic, no need to lock
         try:
-            obj = self._components[index].component
+            return self._components[index].component
         except IndexError:
-            obj = None
-        self._lock.release()
-        return obj
+            return None
 
     def clear(self):
-        self._lock.acquire()
-        self._components.clear()
-        self._lock.release()
+        with self._lock:
+            self._components.clear()
+            self.revision += 1
+
+    @staticmethod
+    def settings_changed():
+        """Invalidate component choices made before a component was reconfigured."""
+        Stack.settings_revision += 1
 
     @property
     def size(self) -> int:
         return len(self._components)
 
     def choose_components(self, settings: SettingsT = None) -> dict[str, ComponentT]:
-        if settings is None:
-            settings = {}
-        suitable = {}
-        for idx in range(self.size):
-            component = self.get(idx, settings)
-            if component is not None:
-                suitable[component.name] = component
-        return suitable
+        # Heap operations can switch threads midway, so iterate over a snapshot
+        with self._lock:
+            components = list(self._components)
+        return {wrapper.component.name: wrapper.component for wrapper in components}
 
     @classmethod
     def transform_submodel(cls, submodel: Type[Model]) -> Type[Model]:
@@ -168,11 +171,6 @@ class Stack:
             component = self.transform_serializer(component, settings=settings)
         return component
 
-    def __del__(self):
-        for component in self._components:
-            component.contained = False
-        self.clear()
-
     def __repr__(self) -> str:
         name = type(self).__name__
         components = list(map(operator.attrgetter("component"), self._components))
@@ -183,6 +181,19 @@ class SelectiveStack(Stack):
     def predicate(self, component, settings: SettingsT):
         return True
 
+    def choose_components(self, settings: SettingsT = None) -> dict[str, ComponentT]:
+        if settings is None:
+            settings = {}
+        with self._lock:
+            components = list(self._components)
+        predicate = self.predicate
+        suitable = {}
+        for wrapper in components:
+            component = wrapper.component
+            if predicate(component, settings):
+                suitable[component.name] = component
+        return suitable
+
     def get(self, index: int = -1, settings: SettingsT = None):
         component = super().get(index, settings)
         if component is None:
@@ -192,6 +203,12 @@ class SelectiveStack(Stack):
         return component
 
 
+def _field_getter(field: str | Callable) -> Callable:
+    if callable(field):
+        return field
+    return lambda component: getattr(component, field, None)
+
+
 class VersionAwareStack(SelectiveStack):
     """
     A very simple and basic versioning layer.  `foo = Int64(version_added=1, version_removed=5)`
@@ -217,25 +234,24 @@ class VersionAwareStack(SelectiveStack):
         self.default_version = default_version
         self.default_version_added = default_version_added
         self.default_version_removed = default_version_removed
+        self._get_version_added = _field_getter(version_added_field)
+        self._get_version_removed = _field_getter(version_removed_field)
+
+    def get_version_bounds(self, component: ComponentT) -> tuple[Comparable, Comparable]:
+        """Return the (version added, version removed) pair of a component."""
+        version_added = self._get_version_added(component)
+        if version_added is None:
+            version_added = self.default_version_added
+        version_removed = self._get_version_removed(component)
+        if version_removed is None:
+            version_removed = self.default_version_removed
+        return version_added, version_removed
 
     def predicate_version(self, component: ComponentT, settings: SettingsT):
         if settings is None:
             settings = {}
         version = settings.get(self.settings_version_field, self.default_version)
-        default_added = self.default_version_added
-        default_removed = self.default_version_removed
-        if callable(self.version_added_field):
-            version_added = self.version_added_field(component)
-        else:
-            version_added = getattr(component, self.version_added_field, None)
-        if version_added is None:
-            version_added = default_added
-        if callable(self.version_added_field):
-            version_removed = self.version_removed_field(component)
-        else:
-            version_removed = getattr(component, self.version_removed_field, None)
-        if version_removed is None:
-            version_removed = default_removed
+        version_added, version_removed = self.get_version_bounds(component)
         introduced = version_added <= version
         up_to_date = version_removed > version
         return introduced and up_to_date
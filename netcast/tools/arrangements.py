@@ -119,6 +119,9 @@ class _BaseArrangement:
     _super_registry: Final[ClassVar[IDLookupDictionary]] = IDLookupDictionary()
     """Helper dict for managing an arrangement's class attributes."""
 
+    _sub_registry: Final[ClassVar[IDLookupDictionary]] = IDLookupDictionary()
+    """Reverse of :attr:`_super_registry`, so that subcontexts are found without a full scan."""
+
     _factory_registry: Final[dict] = {}
     """For creating contexts."""
 
@@ -143,19 +146,12 @@ class _BaseArrangement:
 
     @classmethod
     def _get_subcontexts(cls, self=None):
-        registry = cls._super_registry
-        subcontexts = []
-
         if self is None:
             context = cls._get_context()
         else:
             context = self.context
 
-        for subcontext, supercontext in registry.items():
-            if supercontext is context:
-                subcontexts.append(registry.restore_key(subcontext))
-
-        return tuple(subcontexts)
+        return tuple(cls._sub_registry.get(context, ()))
 
     @classmethod
     def _set_supercontext(
@@ -164,7 +160,16 @@ class _BaseArrangement:
         if context is supercontext:
             raise ValueError("no context can be a supercontext of itself")
 
-        cls._super_registry[context] = supercontext
+        registry = cls._super_registry
+        if context in registry:
+            siblings = cls._sub_registry.get(registry[context], [])
+            for idx, sibling in enumerate(siblings):
+                if sibling is context:
+                    del siblings[idx]
+                    break
+
+        registry[context] = supercontext
+        cls._sub_registry.setdefault(supercontext, []).append(context)
         if bind:
             cls._bind_contexts(context, supercontext)
 
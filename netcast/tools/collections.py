@@ -1,5 +1,6 @@
 from __future__ import annotations  # Python 3.8
 
+import weakref
 from typing import Any, Callable, Protocol, TypeVar, runtime_checkable
 
 from netcast.constants import MISSING
@@ -85,6 +86,72 @@ class IDLookupDictionary(KeyTransformingDict):
         return id_of_key
 
 
+class WeakIDLookupDictionary(KeyTransformingDict):
+    """
+    A dictionary that uses id() for storing and lookup, but does not keep its keys alive.
+    An entry is dropped as soon as its key is garbage collected.
+    Keys that can't be weakly referenced are kept alive until their entry is removed,
+    so that their id can't be reused by another object in the meantime.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._pointers: dict[int, Any] = {}
+        self._finalizers: dict[int, weakref.finalize] = {}
+        super().__init__(*args, **kwargs)
+
+    @staticmethod
+    def transform_key(key):
+        return id(key)
+
+    def _release(self, id_of_key):
+        dict.pop(self, id_of_key, None)
+        self._finalizers.pop(id_of_key, None)
+
+    def _forget(self, id_of_key):
+        finalizer = self._finalizers.pop(id_of_key, None)
+        if finalizer is not None:
+            finalizer.detach()
+        self._pointers.pop(id_of_key, None)
+
+    def __setitem__(self, key, val):
+        id_of_key = id(key)
+        if not dict.__contains__(self, id_of_key):
+            try:
+                finalizer = weakref.finalize(key, self._release, id_of_key)
+            except TypeError:  # not weakly referenceable
+                self._pointers[id_of_key] = key
+            else:
+                finalizer.atexit = False
+                self._finalizers[id_of_key] = finalizer
+        dict.__setitem__(self, id_of_key, val)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._forget(id(key))
+
+    def pop(self, key, default=MISSING):
+        value = super().pop(key, default)
+        self._forget(id(key))
+        return value
+
+    def popitem(self):
+        id_of_key, value = super().popitem()
+        self._forget(id_of_key)
+        return id_of_key, value
+
+    def clear(self):
+        for finalizer in self._finalizers.values():
+            finalizer.detach()
+        self._finalizers.clear()
+        self._pointers.clear()
+        super().clear()
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return super().setdefault(key, default)
+
+
 class AttributeDict(dict):
     """A dictionary with attribute-as-item access."""
 
@@ -30,6 +30,7 @@ from netcast.tools.collections import (
     AttributeDict,
     IDLookupDictionary,
     ParameterHolder,
+    WeakIDLookupDictionary,
 )
 
 try:
@@ -233,11 +234,11 @@ def _call_observer(observer, context, params):
 
 
 class _HookCaller:
-    pools = IDLookupDictionary()
-    observers = IDLookupDictionary()
+    pools = WeakIDLookupDictionary()
+    observers = WeakIDLookupDictionary()
 
     def call_observers(self, context, params, async_=False):
-        observers = self.observers.setdefault(context, [])
+        observers = self.observers.get(context, ())
         trigger = None
 
         if async_:
@@ -257,6 +258,8 @@ class _HookCaller:
 
     def preceding_hook(self, context, func, /, *args, **kwargs):
         """Anytime a context is on the verge of being modified, this method is called."""
+        if not (self.pools or self.observers):
+            return  # nothing to notify, don't pay for the lookups
         pool = self.pools.get(context)
         if pool:
             pool.enter(context, func, sys.exc_info())
@@ -265,6 +268,8 @@ class _HookCaller:
 
     def trailing_hook(self, context, func, /, *args, **kwargs):
         """Anytime a context was modified, this method is called."""
+        if not (self.pools or self.observers):
+            return
         pool = self.pools.get(context)
         if pool:
             pool.exit(context, func, sys.exc_info())
@@ -373,20 +378,26 @@ def wrap_method(
     if func is None:
         raise TypeError("wrapped method can't be None")
 
+    # Resolve the hooks once here, instead of checking them in the wrapper on every call
+    if not callable(preceding_hook):
+        preceding_hook = None
+    if not callable(trailing_hook):
+        trailing_hook = None
+    if preceding_hook is None and trailing_hook is None:
+        return func
+
     if inspect.iscoroutinefunction(func):
 
         async def wrapper(self, *args, **kwargs):
-            method = getattr(self, func.__name__)
-
             hook_kwargs = kwargs
             if pass_method:
-                hook_args = (self, method)
+                hook_args = (self, func)
             else:
                 hook_args = (self,)
 
             hook_args += args
 
-            if callable(preceding_hook):
+            if preceding_hook is not None:
                 trigger = preceding_hook(*hook_args, **hook_kwargs)
 
                 if inspect.isawaitable(trigger):
@@ -400,11 +411,11 @@ def wrap_method(
             finally:
                 if pass_result:
                     if pass_method:
-                        hook_args = (self, method, result)
+                        hook_args = (self, func, result)
                     else:
                         hook_args = (self, result)
 
-                if callable(trailing_hook):
+                if trailing_hook is not None:
                     trigger = trailing_hook(*hook_args, **hook_kwargs)
                     if inspect.isawaitable(trigger):
                         await trigger
@@ -425,17 +436,15 @@ def wrap_method(
             )
 
         def wrapper(self, *args, **kwargs):
-            method = getattr(self, func.__name__)
-
             hook_kwargs = kwargs
             if pass_method:
-                hook_args = (self, method)
+                hook_args = (self, func)
             else:
                 hook_args = (self,)
 
             hook_args += args
 
-            if callable(preceding_hook):
+            if preceding_hook is not None:
                 preceding_hook(*hook_args, **hook_kwargs)
 
             result = MISSING
@@ -446,11 +455,11 @@ def wrap_method(
             finally:
                 if pass_result:
                     if pass_method:
-                        hook_args = (self, method, result)
+                        hook_args = (self, func, result)
                     else:
                         hook_args = (self, result)
 
-                if callable(trailing_hook):
+                if trailing_hook is not None:
                     trailing_hook(*hook_args, **hook_kwargs)
 
                 if result is MISSING:
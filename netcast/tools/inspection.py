@@ -1,5 +1,6 @@
 from __future__ import annotations  # Python 3.8
 
+import functools
 import inspect
 from typing import Any, Callable
 
@@ -8,6 +9,43 @@ def is_classmethod(cls: type, method: Callable) -> bool:
     return getattr(method, "__self__", None) is cls
 
 
+def get_members(
+    cls: type, predicate: Callable[[Any], bool] | None = None
+) -> list[tuple[str, Any]]:
+    """
+    Like inspect.getmembers(cls, predicate), but reads the namespaces along the MRO
+    directly instead of calling getattr() on every name listed by dir(cls).
+    Dunder names are skipped. Members are sorted by name.
+    """
+    members = {}
+    for klass in cls.__mro__:
+        for name, value in vars(klass).items():
+            if name in members or (name.startswith("__") and name.endswith("__")):
+                continue
+            members[name] = value
+    if predicate is not None:
+        members = {name: value for name, value in members.items() if predicate(value)}
+    return sorted(members.items(), key=lambda member: member[0])
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_param_info(func: Callable, bound: bool = False) -> tuple[bool, frozenset[str]]:
+    """Return whether func takes **kwargs and the names it accepts as keyword arguments."""
+    params = list(inspect.signature(func).parameters.values())
+    if bound and params and params[0].kind in (
+        inspect.Parameter.POSITIONAL_ONLY,
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    ):
+        params = params[1:]
+    variadic = any(param.kind is inspect.Parameter.VAR_KEYWORD for param in params)
+    accepted = frozenset(
+        param.name
+        for param in params
+        if param.kind in (param.POSITIONAL_OR_KEYWORD, param.KEYWORD_ONLY)
+    )
+    return variadic, accepted
+
+
 def match_params(func: Callable, kwargs: dict[str, Any]) -> dict[str, Any]:
     """
     def foo(baz, /, bar, biz):
@@ -21,18 +59,15 @@ def match_params(func: Callable, kwargs: dict[str, Any]) -> dict[str, Any]:
     match_params(foo, kwds) -> {"bar": "bar", "biz": "biz"}
     match_params(bar, kwds) -> {"bar": "bar", "biz": "biz", "baz": "baz"}
     """
-    params = inspect.signature(func).parameters
-    variadic = any(
-        param.kind is inspect.Parameter.VAR_KEYWORD for param in params.values()
-    )
-    matched = {}
+    # Bound methods are cached by their function, so that the cache doesn't keep instances alive
+    function = getattr(func, "__func__", None)
+    try:
+        if function is None:
+            variadic, accepted = _get_param_info(func)
+        else:
+            variadic, accepted = _get_param_info(function, bound=True)
+    except TypeError:  # unhashable callable
+        variadic, accepted = _get_param_info.__wrapped__(func)
     if variadic:
-        matched.update(kwargs)
-    else:
-        for name, value in kwargs.items():
-            param = params.get(name)
-            if param is None:
-                continue
-            if param.kind in (param.POSITIONAL_OR_KEYWORD, param.KEYWORD_ONLY):
-                matched[name] = value
-    return matched
+        return dict(kwargs)
+    return {name: value for name, value in kwargs.items() if name in accepted}
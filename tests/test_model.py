@@ -1,3 +1,8 @@
+import copy
+import gc
+
+import pytest
+
 import netcast as nc
 
 
@@ -44,3 +49,102 @@ class TestModel:
         assert isinstance(bar_model.foo, nc.Field)
         assert bar_model.foo.contained
         assert bar_model.stack.size == 1
+
+    def test_ordering(self):
+        class Foo(nc.Model):
+            bar = nc.Integer()
+            baz = nc.Integer()
+
+        class Bar(nc.Model):
+            bar = nc.Integer()
+
+        assert Foo(bar=1, baz=2) < Foo(bar=1, baz=3)
+        assert not Foo(bar=1, baz=3) < Foo(bar=1, baz=2)
+        assert Foo(bar=1, baz=2) == Foo(bar=1, baz=2)
+        # Fields missing from the other model compare as the greatest value
+        assert Foo(bar=1, baz=2) < Bar(bar=1)
+        assert not Foo(bar=2, baz=2) < Bar(bar=1)
+
+    def test_component_choice(self):
+        class Foo(nc.Model):
+            bar = nc.Integer(version_added=2)
+
+        foo = Foo(bar=1)
+        assert foo.get_state(version=1) == {}
+        assert foo.get_state(version=2) == {"bar": 1}
+        assert foo.get_state(version=2) == {"bar": 1}
+        cached = len(Foo._components_cache)
+        # Choices made for unhashable settings are not cached
+        assert foo.get_state(version=2, extra=[1]) == {"bar": 1}
+        assert len(Foo._components_cache) == cached
+        Foo.stack.clear()
+        assert foo.choose_components(version=2) == {}
+
+    def test_reconfigured_component_choice(self):
+        class Sub(nc.Model):
+            baz = nc.Integer()
+
+        class Foo(nc.Model):
+            bar = nc.Integer()
+            sub = Sub
+
+        foo = Foo()
+        assert set(foo.choose_components(version=1)) == {"bar", "sub"}
+        Sub.configure(version_added=2)
+        Foo.bar.component.configure(version_added=2)
+        assert set(foo.choose_components(version=1)) == set()
+
+    def test_load_state(self):
+        class Foo(nc.Model):
+            bar = nc.Integer()
+            baz = nc.String()
+
+        foo = Foo()
+        assert foo.load_state({"bar": 1, "baz": "a"}).get_state() == {"bar": 1, "baz": "a"}
+        assert foo.load_state([2, "b"]).get_state() == {"bar": 2, "baz": "b"}
+        for load in ("cd", b"cd", bytearray(b"cd"), memoryview(b"cd")):
+            with pytest.raises(TypeError):
+                foo.load_state(load)
+
+    def test_subclass_include(self):
+        class Foo(nc.Model):
+            bar = nc.Integer()
+            baz = nc.Integer()
+
+        class Bar(Foo, include=("bar",)):
+            biz = nc.String()
+
+        assert Bar.name == "bar"
+        assert sorted(component.name for component in Bar.stack.all()) == ["bar", "biz"]
+
+        with pytest.raises(ValueError):
+            class Baz(Foo, include=("missing",)):
+                pass
+
+    def test_collected_subclass(self):
+        class Foo(nc.Model):
+            bar = nc.Integer()
+
+        def define_subclass():
+            class Bar(Foo):
+                pass
+
+        define_subclass()
+        gc.collect()
+
+        # Components shared with a collected subclass stay owned by the base stack
+        assert Foo.stack.get(0).contained
+
+    def test_collected_states(self):
+        class Foo(nc.Model):
+            bar = nc.Integer()
+
+        foo = Foo(bar=1)
+        for create in (Foo, lambda: copy.copy(foo)):
+            model = create()
+            model.bar = 42
+            id_of_model = id(model)
+            del model
+            gc.collect()
+            assert id_of_model not in Foo.bar.states
+            assert Foo().get_state(None) == {"bar": None}
@@ -47,6 +47,16 @@ class TestStack:
         with pytest.raises(IndexError):
             stack.pop()
 
+    def test_discard(self, stack, serializer_class):
+        first, second = serializer_class(), serializer_class()
+        stack.push(first)
+        stack.push(second)
+        stack.discard(first)
+        assert stack.size == 1
+        assert stack.get() is second
+        stack.discard(first)
+        assert stack.size == 1
+
     def test_add(self, stack, serializer_class):
         stack.add(serializer_class)
         assert stack.pop() is not serializer_class
@@ -90,7 +100,17 @@ class TestVersionAwareStack:
 
         assert stack.predicate(component, settings=settings)
         assert stack.get(settings=settings) is not None
+        assert stack.choose_components(settings) == {component.name: component}
 
         settings[stack.settings_version_field] = incompatible_version
         assert not stack.predicate(component, settings=settings)
         assert stack.get(settings=settings) is None
+        assert stack.choose_components(settings) == {}
+
+    def test_changed_settings(self, serializer):
+        stack, component = self.duplex_factory(serializer=serializer)
+        settings = {stack.settings_version_field: 1}
+
+        assert stack.choose_components(settings) == {component.name: component}
+        component.settings["version_added"] = 2
+        assert stack.choose_components(settings) == {}
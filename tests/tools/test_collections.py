@@ -0,0 +1,67 @@
+import gc
+
+import pytest
+
+from netcast.tools.collections import WeakIDLookupDictionary
+
+
+class _Key:
+    pass
+
+
+class _SlottedKey:
+    __slots__ = ()
+
+
+class TestWeakIDLookupDictionary:
+    def test_collected_key(self):
+        mapping = WeakIDLookupDictionary()
+        key = _Key()
+        mapping[key] = 1
+        assert mapping[key] == 1
+
+        del key
+        gc.collect()
+        assert not mapping
+        assert not mapping._finalizers
+
+    def test_unreferenceable_key(self):
+        mapping = WeakIDLookupDictionary()
+        key = _SlottedKey()
+        id_of_key = id(key)
+        mapping[key] = 1
+
+        del key
+        gc.collect()
+        # The key is kept alive, so its id can't be reused by another object
+        assert mapping._pointers[id_of_key] is not None
+        assert dict.__contains__(mapping, id_of_key)
+
+    @pytest.mark.parametrize("key_class", [_Key, _SlottedKey])
+    def test_removal(self, key_class):
+        mapping = WeakIDLookupDictionary()
+        key = key_class()
+
+        mapping[key] = 1
+        del mapping[key]
+        assert key not in mapping
+        mapping[key] = 2
+        assert mapping.pop(key) == 2
+        assert mapping.pop(key, None) is None
+        mapping[key] = 3
+        assert mapping.popitem() == (id(key), 3)
+        mapping[key] = 4
+        mapping.clear()
+
+        assert not mapping
+        assert not mapping._pointers
+        assert not mapping._finalizers
+
+    def test_reinsertion(self):
+        mapping = WeakIDLookupDictionary()
+        key = _Key()
+        for value in range(3):
+            mapping[key] = value
+            del mapping[key]
+        mapping[key] = 3
+        assert len(mapping._finalizers) == 1